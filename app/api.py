@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import Executor
 from datetime import datetime, timezone
-from uuid import uuid4
 
+import numpy as np
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from fastapi.responses import FileResponse
-from PIL import Image
 
 from .camera import CameraCaptureError, CameraManager, parse_resolution
 from .config import Settings, get_settings
-from .models import CaptureImageItem, CaptureRequest, CaptureResponse
+from .models import CaptureRequest, CaptureResponse
+from .responses import OrjsonResponse
 from .storage import ImageStorage
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_SUPPORTED_FORMATS = frozenset({"jpeg", "png"})
+_IMAGE_URL_PREFIX = "/api/images/"
+_utcnow = datetime.now
+_UTC = timezone.utc
+
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check() -> dict:
@@ -25,9 +32,21 @@ async def health_check() -> dict:
     return {"status": "healthy", "service": "camera"}
 
 
-def get_storage(settings: Settings = Depends(get_settings)) -> ImageStorage:
-    """Dependency provider for ImageStorage."""
-    return ImageStorage(settings.camera_storage_dir)
+def get_storage(request: Request) -> ImageStorage:
+    """Return the shared ImageStorage stored on the FastAPI app."""
+    storage = getattr(request.app.state, "image_storage", None)
+    if storage is None:
+        logger.error("Image storage requested before initialization.")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Image storage is not available.",
+        )
+    return storage
+
+
+def get_io_pool(request: Request) -> Executor | None:
+    """Return the shared I/O executor; None means the loop's default executor."""
+    return getattr(request.app.state, "io_pool", None)
 
 
 def get_camera_manager(request: Request) -> CameraManager:
@@ -62,7 +81,8 @@ async def capture_image(
     camera_manager: CameraManager = Depends(get_camera_manager),
     extra_camera_managers: list[CameraManager] = Depends(get_extra_camera_managers),
     storage: ImageStorage = Depends(get_storage),
-) -> CaptureResponse:
+    io_pool: Executor | None = Depends(get_io_pool),
+) -> OrjsonResponse:
     """Trigger an image capture and return metadata."""
     payload = capture_request or CaptureRequest()
 
@@ -76,7 +96,7 @@ async def capture_image(
         logger.exception("Failed to parse resolution '%s'", resolution_str)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    if image_format not in {"jpeg", "png"}:
+    if image_format not in _SUPPORTED_FORMATS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Format must be either 'jpeg' or 'png'.",
@@ -92,70 +112,101 @@ async def capture_image(
         },
     )
 
-    def _capture_and_store(manager: CameraManager, index: int) -> CaptureImageItem:
-        frame = manager.capture_fresh_frame(
+    loop = asyncio.get_running_loop()
+
+    async def _capture(manager: CameraManager) -> np.ndarray:
+        # Captures mostly wait on the reader thread, so only saves use the I/O pool.
+        return await asyncio.to_thread(
+            manager.capture_fresh_frame,
             resolution=resolution,
             format=image_format,
             quality=quality,
         )
-        image = Image.fromarray(frame)
-        image_id = uuid4().hex
-        file_path = storage.save_image(image, image_id, image_format, quality)
-        logger.info("Stored captured image at %s", file_path)
-        return CaptureImageItem(
-            index=index,
-            image_id=image_id,
-            image_url_or_path=f"/api/images/{file_path.name}",
+
+    async def _store(frame: np.ndarray) -> tuple[str, str]:
+        image_id = storage.new_image_id()
+        file_path = await loop.run_in_executor(
+            io_pool, storage.save_frame, frame, image_id, image_format, quality
         )
+        logger.info("Stored captured image at %s", file_path)
+        return image_id, _IMAGE_URL_PREFIX + file_path.name
+
+    # With use_extra, the main and extra cameras are captured concurrently;
+    # nothing is saved unless the main capture succeeds.
+    managers = [camera_manager]
+    if payload.use_extra:
+        managers.extend(extra_camera_managers)
+    main_result, *extra_results = await asyncio.gather(
+        *(_capture(manager) for manager in managers),
+        return_exceptions=True,
+    )
 
-    try:
-        main_capture = _capture_and_store(camera_manager, index=0)
-    except CameraCaptureError as exc:
-        logger.exception(
+    if isinstance(main_result, CameraCaptureError):
+        logger.error(
             "Main camera capture failed",
             extra={
                 "resolution": f"{resolution[0]}x{resolution[1]}",
                 "format": image_format,
                 "quality": quality,
             },
+            exc_info=main_result,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Camera capture failed.",
-        ) from exc
-
-    timestamp = datetime.now(timezone.utc)
+        ) from main_result
+    if isinstance(main_result, BaseException):
+        raise main_result
+
+    frames = [main_result]
+    for result in extra_results:
+        if isinstance(result, CameraCaptureError):
+            logger.warning("Extra camera capture failed; skipping source.", exc_info=result)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        frames.append(result)
+
+    stored = await asyncio.gather(*(_store(frame) for frame in frames))
+    main_image_id, main_image_url = stored[0]
+    body: dict = {
+        "image_id": main_image_id,
+        "image_url_or_path": main_image_url,
+        "timestamp": _utcnow(_UTC),
+    }
 
     if not payload.use_extra:
-        return CaptureResponse(
-            image_id=main_capture.image_id,
-            image_url_or_path=main_capture.image_url_or_path,
-            timestamp=timestamp,
-        )
+        return OrjsonResponse(body)
 
-    captures: list[CaptureImageItem] = [main_capture]
-    for extra_camera_manager in extra_camera_managers:
-        try:
-            captures.append(_capture_and_store(extra_camera_manager, index=len(captures)))
-        except CameraCaptureError as exc:
-            logger.warning("Extra camera capture failed; skipping source.", exc_info=exc)
-
-    return CaptureResponse(
-        image_id=main_capture.image_id,
-        image_url_or_path=main_capture.image_url_or_path,
-        timestamp=timestamp,
-        images=captures,
-    )
+    captures: list[dict] = [
+        {"index": index, "image_id": image_id, "image_url_or_path": image_url}
+        for index, (image_id, image_url) in enumerate(stored)
+    ]
+    body["images"] = captures
+    return OrjsonResponse(body)
+
+
+class _ImageFileResponse(FileResponse):
+    """FileResponse that streams captured images in larger chunks."""
+
+    chunk_size = 256 * 1024
 
 
 @router.get("/api/images/{image_filename}")
 async def fetch_image(
     image_filename: str,
+    settings: Settings = Depends(get_settings),
     storage: ImageStorage = Depends(get_storage),
 ) -> FileResponse:
     """Serve binary image data for the requested file."""
-    file_path = storage.resolve_image_path(image_filename)
+    file_path, stat_result = storage.resolve_image_path(image_filename)
     media_type = storage.guess_media_type(file_path)
-    return FileResponse(path=file_path, media_type=media_type)
-
-
+    # Image names are unique per capture, so the content never changes and
+    # clients may cache it until the file is due for cleanup.
+    cache_control = f"public, max-age={settings.camera_retention_seconds}, immutable"
+    return _ImageFileResponse(
+        path=file_path,
+        media_type=media_type,
+        stat_result=stat_result,
+        headers={"Cache-Control": cache_control},
+    )
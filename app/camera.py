@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import logging
+import math
 import random
-from threading import Lock
-from typing import Set, Tuple
+import time
+from functools import lru_cache
+from threading import Condition, Event, Lock, Thread
+from typing import FrozenSet, NamedTuple, Set, Tuple
 
 import numpy as np
 from PIL import Image, ImageDraw
 
+try:
+    import cv2
+except ImportError:  # pragma: no cover - enforced by requirements
+    cv2 = None
+
 logger = logging.getLogger(__name__)
 
+# Dummy-mode placeholders up to this size are cached and shared.
+_PLACEHOLDER_CACHE_MAX_PIXELS = 1920 * 1080
+_WHITE_PIXEL = np.full(3, 255, dtype=np.uint8).view("V3")[0]
+
 
+@lru_cache(maxsize=64)
 def parse_resolution(resolution: str) -> Tuple[int, int]:
     """Parse a resolution string formatted as '<width>x<height>'."""
     if not resolution:
@@ -40,6 +53,7 @@ def parse_extra_camera_sources(raw_sources: str | None) -> list[str]:
     return [token.strip() for token in raw_sources.split(",") if token.strip()]
 
 
+@lru_cache(maxsize=64)
 def normalize_camera_source(source: str) -> str:
     """Normalize source representation for deterministic logging and comparison."""
     token = source.strip()
@@ -51,7 +65,8 @@ def normalize_camera_source(source: str) -> str:
     return f"raw:{token}"
 
 
-def source_equivalence_keys(source: str) -> Set[str]:
+@lru_cache(maxsize=64)
+def source_equivalence_keys(source: str) -> FrozenSet[str]:
     """
     Return keys used for duplicate detection.
 
@@ -65,7 +80,7 @@ def source_equivalence_keys(source: str) -> Set[str]:
         index_value = int(token)
         keys.add(f"index:{index_value}")
         keys.add(f"dev:/dev/video{index_value}")
-        return keys
+        return frozenset(keys)
 
     if token_lower.startswith("/dev/video"):
         suffix = token_lower[len("/dev/video") :]
@@ -74,7 +89,26 @@ def source_equivalence_keys(source: str) -> Set[str]:
             keys.add(f"index:{index_value}")
             keys.add(f"dev:/dev/video{index_value}")
 
-    return keys
+    return frozenset(keys)
+
+
+class SourceInfo(NamedTuple):
+    """Everything derived from a configured camera source token."""
+
+    raw: str
+    normalized: str
+    keys: FrozenSet[str]
+    device_index: int
+
+
+def describe_camera_source(source: str) -> SourceInfo:
+    """Parse a source token once into the values startup needs from it."""
+    return SourceInfo(
+        raw=source,
+        normalized=normalize_camera_source(source),
+        keys=source_equivalence_keys(source),
+        device_index=int(source) if source.isdigit() else 0,
+    )
 
 
 class CameraError(RuntimeError):
@@ -93,6 +127,9 @@ class CameraManager:
     """Deterministic controller for a single camera device."""
 
     _dummy_sources = {"", "dummy", "simulator", "placeholder"}
+    _frame_timeout_seconds = 2.0
+    _read_retry_seconds = 0.05
+    _reader_join_timeout_seconds = 2.0
 
     def __init__(
         self,
@@ -108,11 +145,16 @@ class CameraManager:
         self.buffer_size = buffer_size if buffer_size and buffer_size > 0 else None
         self._lock = Lock()
         self._capture = None
+        self._reader: Thread | None = None
+        self._stop_reading = Event()
+        self._frame_ready = Condition()
+        self._latest_frame: np.ndarray | None = None
+        self._latest_frame_time = 0.0
         self._dummy_mode = self._is_dummy_source(self.source)
         self._started = False
 
     def start(self) -> None:
-        """Open the camera device, configure it, and verify it works."""
+        """Open the camera device, configure it, and start the reader thread."""
         with self._lock:
             if self._started:
                 return
@@ -125,10 +167,8 @@ class CameraManager:
                 self._started = True
                 return
 
-            try:
-                import cv2
-            except ImportError as exc:  # pragma: no cover - enforced by requirements
-                raise CameraInitializationError("OpenCV is required to open the camera.") from exc
+            if cv2 is None:  # pragma: no cover - enforced by requirements
+                raise CameraInitializationError("OpenCV is required to open the camera.")
 
             capture_source = self._resolve_capture_source()
             logger.info("Opening camera device", extra={"source": capture_source})
@@ -146,17 +186,38 @@ class CameraManager:
                     )
 
             self._capture = capture
+            # Each reader gets its own stop signal, so a reader that outlived
+            # an earlier stop() cannot be revived by this start().
+            self._stop_reading = Event()
+            self._reader = Thread(
+                target=self._read_frames,
+                args=(capture, self._stop_reading),
+                name=f"camera-reader-{self.source}",
+                daemon=True,
+            )
             self._started = True
+            self._reader.start()
             logger.info("Camera device ready", extra={"source": capture_source})
 
     def stop(self) -> None:
-        """Release the camera device cleanly."""
+        """Stop the reader thread and release the camera device cleanly."""
         with self._lock:
-            if self._capture is not None:
-                logger.info("Releasing camera source %s", self.source)
-                self._capture.release()
-                self._capture = None
-            self._started = False
+            self._stop_reading.set()
+            if self._reader is not None:
+                self._reader.join(timeout=self._reader_join_timeout_seconds)
+                if self._reader.is_alive():
+                    logger.warning(
+                        "Camera reader thread did not stop in time",
+                        extra={"source": self.source},
+                    )
+                self._reader = None
+            self._capture = None
+
+            with self._frame_ready:
+                self._started = False
+                self._latest_frame = None
+                self._latest_frame_time = 0.0
+                self._frame_ready.notify_all()
 
     def capture_fresh_frame(
         self,
@@ -164,39 +225,70 @@ class CameraManager:
         format: str,
         quality: int,
     ) -> np.ndarray:
-        """Return a fresh frame from the camera."""
+        """Return a BGR frame read after this call started; dummy frames are read-only."""
         width, height = resolution
 
-        with self._lock:
+        if self._dummy_mode:
             if not self._started:
                 raise CameraCaptureError("Camera has not been started.")
-
-            if self._dummy_mode:
-                return self._generate_dummy_frame(width, height)
-
-            capture = self._capture
-            if capture is None:
-                raise CameraCaptureError("Camera capture device is unavailable.")
-
-            try:
-                import cv2
-            except ImportError as exc:  # pragma: no cover - enforced by requirements
-                raise CameraCaptureError("OpenCV is required to read from the camera.") from exc
-
-            if self.warmup_frames > 0:
-                for _ in range(self.warmup_frames):
-                    capture.read()
-
-            success, frame = capture.read()
-
-            if not success or frame is None:
-                raise CameraCaptureError("Failed to read frame from camera.")
-
-            if frame.shape[1] != width or frame.shape[0] != height:
-                frame = cv2.resize(frame, (width, height))
-
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            return frame_rgb
+            return self._generate_dummy_frame(width, height)
+
+        requested_at = time.monotonic()
+        with self._frame_ready:
+            fresh = self._frame_ready.wait_for(
+                lambda: not self._started or self._latest_frame_time > requested_at,
+                timeout=self._frame_timeout_seconds,
+            )
+            if not self._started:
+                raise CameraCaptureError("Camera has not been started.")
+            latest = self._latest_frame
+            if not fresh or latest is None:
+                raise CameraCaptureError("Timed out waiting for a fresh camera frame.")
+
+            # Resize straight out of the shared frame; only a native-size frame needs a copy.
+            if latest.shape[1] != width or latest.shape[0] != height:
+                return cv2.resize(latest, (width, height))
+            return latest.copy()
+
+    def _read_frames(self, capture, stop_reading: Event) -> None:
+        """Reader thread body: publish the newest frame until stopped, then release."""
+        try:
+            # Discard a few frames after opening so exposure can settle.
+            for _ in range(self.warmup_frames):
+                if stop_reading.is_set():
+                    return
+                capture.grab()
+
+            spare: np.ndarray | None = None
+            failing = False
+            while not stop_reading.is_set():
+                success, frame = capture.read(spare)
+                if not success or frame is None:
+                    if not failing:
+                        logger.warning(
+                            "Failed to read frame from camera",
+                            extra={"source": self.source},
+                        )
+                        failing = True
+                    spare = None
+                    stop_reading.wait(self._read_retry_seconds)
+                    continue
+
+                if failing:
+                    logger.info("Camera frames available again", extra={"source": self.source})
+                    failing = False
+
+                # Double buffering: the replaced frame becomes the next read target.
+                with self._frame_ready:
+                    if stop_reading.is_set():
+                        break
+                    spare = self._latest_frame
+                    self._latest_frame = frame
+                    self._latest_frame_time = time.monotonic()
+                    self._frame_ready.notify_all()
+        finally:
+            logger.info("Releasing camera source %s", self.source)
+            capture.release()
 
     def _resolve_capture_source(self) -> int | str:
         """Interpret the configured source into an OpenCV-compatible value."""
@@ -210,21 +302,53 @@ class CameraManager:
 
     @staticmethod
     def _generate_dummy_frame(width: int, height: int) -> np.ndarray:
-        image = _generate_placeholder_image(width, height)
-        return np.array(image)
-
-
-def _generate_placeholder_image(width: int, height: int) -> Image.Image:
-    """Produce a placeholder gradient image for demonstration."""
-    base_color = tuple(random.randint(64, 192) for _ in range(3))
-    image = Image.new("RGB", (width, height), base_color)
-    draw = ImageDraw.Draw(image)
-
-    draw.line((0, 0, width, height), fill="white", width=max(1, width // 80))
-    draw.line((0, height, width, 0), fill="white", width=max(1, width // 80))
-
-    text = f"{width}x{height}"
-    text_position = (width // 10, height // 10)
-    draw.text(text_position, text, fill="black")
-    return image
-
+        # Only a few modest sizes are kept, since clients choose the resolution.
+        if width * height <= _PLACEHOLDER_CACHE_MAX_PIXELS:
+            return _cached_placeholder_frame(width, height)
+        return _generate_placeholder_frame(width, height)
+
+
+def _generate_placeholder_frame(width: int, height: int) -> np.ndarray:
+    """Produce a read-only placeholder frame with crossed diagonals and a size label."""
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    # Fill one row and broadcast it to the rest.
+    frame[0] = [random.randint(64, 192) for _ in range(3)]
+    frame[1:] = frame[0]
+
+    lines = _diagonal_mask(width, height, max(1, width // 80))
+    lines |= lines[:, ::-1]
+    # Viewing each BGR pixel as one 3-byte item lets a 2-D mask paint whole pixels.
+    np.copyto(frame.view("V3")[..., 0], _WHITE_PIXEL, where=lines)
+
+    label = _label_bitmap(f"{width}x{height}")
+    top, left = height // 10, width // 10
+    region = frame[top : top + label.shape[0], left : left + label.shape[1]]
+    region[label[: region.shape[0], : region.shape[1]]] = 0
+
+    frame.flags.writeable = False
+    return frame
+
+
+def _diagonal_mask(width: int, height: int, line_width: int) -> np.ndarray:
+    """Mask the pixels whose centres lie within half a line width of the main diagonal."""
+    if height > width:
+        # Build along the longer axis so the broadcast rows stay long.
+        return _diagonal_mask(height, width, line_width).T
+    half_run = line_width / 2 * math.hypot(width, height) / height
+    centres = (np.arange(height) + 0.5) * (width / height) - 0.5
+    columns = np.arange(width)
+    mask = columns >= np.ceil(centres - half_run)[:, None]
+    mask &= columns <= np.floor(centres + half_run)[:, None]
+    return mask
+
+
+@lru_cache(maxsize=16)
+def _label_bitmap(text: str) -> np.ndarray:
+    """Render text once into a bitmap just large enough to hold it."""
+    _, _, right, bottom = ImageDraw.Draw(Image.new("1", (1, 1))).textbbox((0, 0), text)
+    bitmap = Image.new("1", (right, bottom), 0)
+    ImageDraw.Draw(bitmap).text((0, 0), text, fill=1)
+    return np.asarray(bitmap)
+
+
+_cached_placeholder_frame = lru_cache(maxsize=4)(_generate_placeholder_frame)
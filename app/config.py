@@ -15,7 +15,7 @@ class Settings(BaseSettings):
     camera_storage_dir: Path = Field(default=Path("./data/images"))
     camera_default_resolution: str = Field(default="320x320")
     camera_default_format: str = Field(default="jpeg")
-    camera_default_quality: int = Field(default=95)
+    camera_default_quality: int = Field(default=85)
     main_camera_source: str | None = Field(
         default="0",
         description="Primary camera source identifier, e.g. 'dummy', '0', or '/dev/video0'.",
@@ -43,13 +43,22 @@ class Settings(BaseSettings):
     camera_warmup_frames: int = Field(
         default=3,
         ge=0,
-        description="Number of frames to discard before using a capture.",
+        description="Number of frames to discard after opening the camera.",
     )
     camera_buffer_size: int = Field(
         default=1,
         ge=1,
         description="Requested OpenCV buffer size to minimize stale frames.",
     )
+    camera_jpeg_optimize: bool = Field(
+        default=False,
+        description="Run libjpeg's optimized-Huffman pass; smaller files, slower encodes.",
+    )
+    camera_io_threads: int = Field(
+        default=2,
+        ge=1,
+        description="Worker threads shared by image saves and cleanup.",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="",
@@ -5,9 +5,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from contextlib import suppress
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 import inspect
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from fastapi import FastAPI
 
@@ -15,39 +16,27 @@ from .api import router
 from .camera import (
     CameraInitializationError,
     CameraManager,
-    normalize_camera_source,
+    SourceInfo,
+    describe_camera_source,
     parse_extra_camera_sources,
-    source_equivalence_keys,
 )
 from .config import Settings, get_settings
+from .responses import OrjsonResponse
+from .storage import ImageStorage
 
 logger = logging.getLogger(__name__)
 
 
-async def cleanup_loop(settings: Settings) -> None:
+async def cleanup_loop(settings: Settings, storage: ImageStorage, io_pool: Executor) -> None:
     """Background task that deletes expired images on a fixed interval."""
-    storage_dir = settings.camera_storage_dir
-    storage_dir.mkdir(parents=True, exist_ok=True)
-
+    loop = asyncio.get_running_loop()
+    retention = settings.camera_retention_seconds
+    interval = settings.camera_cleanup_interval_seconds
     try:
         while True:
             try:
-                cutoff = time.time() - settings.camera_retention_seconds
-                deleted = 0
-
-                for path in storage_dir.glob("*"):
-                    if not path.is_file():
-                        continue
-
-                    try:
-                        if path.stat().st_mtime < cutoff:
-                            path.unlink()
-                            deleted += 1
-                    except Exception as exc:
-                        logger.warning(
-                            "Failed to delete old image",
-                            extra={"path": str(path), "error": str(exc)},
-                        )
+                cutoff = time.time() - retention
+                deleted = await loop.run_in_executor(io_pool, storage.delete_expired, cutoff)
 
                 if deleted > 0:
                     logger.info(
@@ -57,50 +46,55 @@ async def cleanup_loop(settings: Settings) -> None:
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.error("Camera cleanup loop error", extra={"error": str(exc)})
 
-            await asyncio.sleep(settings.camera_cleanup_interval_seconds)
+            await asyncio.sleep(interval)
     except asyncio.CancelledError:  # pragma: no cover - cleanup path
         logger.info("Cleanup loop cancelled")
         raise
 
 
-def _build_camera_manager(settings: Settings, source: str) -> CameraManager:
-    """Build a CameraManager instance for a specific source token."""
-    device_index = int(source) if source.isdigit() else 0
+def _build_camera_manager(settings: Settings, source: SourceInfo) -> CameraManager:
+    """Build a CameraManager instance for a specific source."""
     return CameraManager(
-        device_index=device_index,
-        source=source,
+        device_index=source.device_index,
+        source=source.raw,
         warmup_frames=settings.camera_warmup_frames,
         buffer_size=settings.camera_buffer_size,
     )
 
 
-def _validate_main_extra_duplicates(main_source: str, extra_sources: Sequence[str]) -> None:
+def _validate_main_extra_duplicates(
+    main_source: SourceInfo,
+    extra_sources: Sequence[SourceInfo],
+) -> None:
     """Fail fast if any extra source resolves to the same camera as main."""
-    main_keys = source_equivalence_keys(main_source)
-    main_normalized = normalize_camera_source(main_source)
     for extra_source in extra_sources:
-        extra_keys = source_equivalence_keys(extra_source)
-        if main_keys.intersection(extra_keys):
+        if not main_source.keys.isdisjoint(extra_source.keys):
             logger.error(
                 "Extra camera source duplicates main camera source",
                 extra={
-                    "main_source": main_source,
-                    "main_normalized": main_normalized,
-                    "extra_source": extra_source,
-                    "extra_normalized": normalize_camera_source(extra_source),
+                    "main_source": main_source.raw,
+                    "main_normalized": main_source.normalized,
+                    "extra_source": extra_source.raw,
+                    "extra_normalized": extra_source.normalized,
                 },
             )
             raise SystemExit(1)
 
 
-def initialize_camera_managers(settings: Settings) -> tuple[CameraManager, list[CameraManager]]:
+async def initialize_camera_managers(
+    settings: Settings,
+) -> tuple[CameraManager, list[CameraManager]]:
     """
     Initialize the main camera manager and any extra managers.
 
     Main camera failures are fatal, while extra camera failures are warnings only.
     """
-    main_source = settings.main_camera_source or ""
-    extra_sources = parse_extra_camera_sources(settings.extra_camera_sources)
+    # Parse each source once; validation, construction and logging share it.
+    main_source = describe_camera_source(settings.main_camera_source or "")
+    extra_sources = [
+        describe_camera_source(token)
+        for token in parse_extra_camera_sources(settings.extra_camera_sources)
+    ]
 
     if settings.used_deprecated_camera_source:
         logger.warning(
@@ -111,8 +105,8 @@ def initialize_camera_managers(settings: Settings) -> tuple[CameraManager, list[
     logger.info(
         "Resolved camera sources",
         extra={
-            "main_source": main_source,
-            "main_normalized": normalize_camera_source(main_source),
+            "main_source": main_source.raw,
+            "main_normalized": main_source.normalized,
             "configured_extra_count": len(extra_sources),
         },
     )
@@ -126,34 +120,42 @@ def initialize_camera_managers(settings: Settings) -> tuple[CameraManager, list[
         logger.error(
             "Failed to initialize main camera source",
             extra={
-                "source": main_source,
-                "normalized_source": normalize_camera_source(main_source),
+                "source": main_source.raw,
+                "normalized_source": main_source.normalized,
             },
             exc_info=exc,
         )
         raise SystemExit(1) from exc
 
+    candidate_managers = [
+        _build_camera_manager(settings, extra_source) for extra_source in extra_sources
+    ]
+    start_results = await asyncio.gather(
+        *(asyncio.to_thread(manager.start) for manager in candidate_managers),
+        return_exceptions=True,
+    )
+
     extra_managers: list[CameraManager] = []
-    for extra_source in extra_sources:
-        extra_manager = _build_camera_manager(settings, extra_source)
-        try:
-            extra_manager.start()
-        except CameraInitializationError as exc:
+    started = zip(extra_sources, candidate_managers, start_results)
+    for extra_source, extra_manager, result in started:
+        if isinstance(result, CameraInitializationError):
             logger.warning(
                 "Failed to initialize extra camera source; ignoring source.",
                 extra={
-                    "source": extra_source,
-                    "normalized_source": normalize_camera_source(extra_source),
+                    "source": extra_source.raw,
+                    "normalized_source": extra_source.normalized,
                 },
-                exc_info=exc,
+                exc_info=result,
             )
             continue
+        if isinstance(result, BaseException):
+            raise result
         extra_managers.append(extra_manager)
 
     logger.info(
         "Camera initialization complete",
         extra={
-            "main_source": main_source,
+            "main_source": main_source.raw,
             "active_extra_count": len(extra_managers),
             "configured_extra_count": len(extra_sources),
         },
@@ -161,6 +163,83 @@ def initialize_camera_managers(settings: Settings) -> tuple[CameraManager, list[
     return main_manager, extra_managers
 
 
+async def _resolve_settings(app: FastAPI) -> Settings:
+    """Return settings, honouring a get_settings dependency override."""
+    override = app.dependency_overrides.get(get_settings)
+    if override is None:
+        return get_settings()
+
+    candidate = override()
+    if inspect.isawaitable(candidate):
+        return await candidate
+    return candidate
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the cameras and cleanup loop, and release them on shutdown."""
+    settings = await _resolve_settings(app)
+    image_storage = ImageStorage(
+        settings.camera_storage_dir,
+        optimize_jpeg=settings.camera_jpeg_optimize,
+    )
+    io_pool = ThreadPoolExecutor(
+        max_workers=settings.camera_io_threads,
+        thread_name_prefix="cam-io",
+    )
+    camera_manager: CameraManager | None = None
+    extra_camera_managers: list[CameraManager] = []
+    cleanup_task: asyncio.Task | None = None
+    try:
+        # Index images left by a previous run before serving, so the scan cannot
+        # race a save and track the same file twice.
+        try:
+            indexed = await asyncio.get_running_loop().run_in_executor(
+                io_pool, image_storage.index_existing_images
+            )
+            logger.info("Indexed existing images for cleanup", extra={"indexed": indexed})
+        except OSError as exc:
+            logger.error("Failed to index existing images", extra={"error": str(exc)})
+
+        camera_manager, extra_camera_managers = await initialize_camera_managers(settings)
+        cleanup_task = asyncio.create_task(cleanup_loop(settings, image_storage, io_pool))
+
+        app.state.camera_manager = camera_manager
+        app.state.extra_camera_managers = extra_camera_managers
+        app.state.image_storage = image_storage
+        app.state.io_pool = io_pool
+        app.state.cleanup_task = cleanup_task
+        yield
+    finally:
+        if cleanup_task is not None:
+            cleanup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await cleanup_task
+        app.state.cleanup_task = None
+
+        # Stop cameras concurrently and off the event loop; each stop may wait
+        # for its reader thread.
+        managers = [camera_manager, *extra_camera_managers] if camera_manager is not None else []
+        results = await asyncio.gather(
+            *(asyncio.to_thread(manager.stop) for manager in managers),
+            return_exceptions=True,
+        )
+        for manager, result in zip(managers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to stop camera source",
+                    extra={"source": manager.source},
+                    exc_info=result,
+                )
+        app.state.camera_manager = None
+        app.state.extra_camera_managers = []
+
+        # Let pending saves and deletes finish before storage goes away.
+        await asyncio.to_thread(io_pool.shutdown, True)
+        app.state.io_pool = None
+        app.state.image_storage = None
+
+
 def create_app() -> FastAPI:
     """Build and configure the FastAPI application."""
     logging.basicConfig(level=logging.INFO)
@@ -168,54 +247,16 @@ def create_app() -> FastAPI:
         title="Camera Service",
         description="Passive camera microservice used by the Brain orchestrator.",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
     app.include_router(router)
     app.state.camera_manager = None
     app.state.extra_camera_managers = []
+    app.state.image_storage = None
+    app.state.io_pool = None
     app.state.cleanup_task = None
-
-    async def _resolve_settings() -> Settings:
-        override = app.dependency_overrides.get(get_settings)
-        if override is None:
-            return get_settings()
-
-        candidate = override()
-        if inspect.isawaitable(candidate):
-            return await candidate
-        return candidate
-
-    @app.on_event("startup")
-    async def start_services() -> None:
-        """Start the camera manager and background cleanup loop."""
-        settings = await _resolve_settings()
-        camera_manager, extra_camera_managers = initialize_camera_managers(settings)
-        app.state.camera_manager = camera_manager
-        app.state.extra_camera_managers = extra_camera_managers
-        app.state.cleanup_task = asyncio.create_task(cleanup_loop(settings))
-
-    @app.on_event("shutdown")
-    async def shutdown_services() -> None:
-        """Stop the cleanup loop and release the camera."""
-        cleanup_task = getattr(app.state, "cleanup_task", None)
-        if cleanup_task:
-            cleanup_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await cleanup_task
-            app.state.cleanup_task = None
-
-        camera_manager = getattr(app.state, "camera_manager", None)
-        if camera_manager:
-            camera_manager.stop()
-            app.state.camera_manager = None
-
-        extra_camera_managers = getattr(app.state, "extra_camera_managers", [])
-        for extra_camera_manager in extra_camera_managers:
-            extra_camera_manager.stop()
-        app.state.extra_camera_managers = []
-
     return app
 
 
 app = create_app()
-
-
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints
+
+# Lower-casing runs inside pydantic-core rather than as a Python validator.
+_LowercaseStr = Annotated[str, StringConstraints(to_lower=True)]
 
 
 class CaptureRequest(BaseModel):
     """Request body for the /capture endpoint."""
 
-    resolution: Optional[str] = Field(
+    resolution: Optional[_LowercaseStr] = Field(
         default=None,
         description='Resolution string formatted as "WIDTHxHEIGHT", e.g. "1920x1080".',
     )
@@ -30,16 +33,6 @@ class CaptureRequest(BaseModel):
         description="When true, capture from main and all initialized extra cameras.",
     )
 
-    @field_validator("resolution")
-    @classmethod
-    def _normalize_resolution(cls, value: Optional[str]) -> Optional[str]:
-        return value.lower() if value else value
-
-    @field_validator("format")
-    @classmethod
-    def _normalize_format(cls, value: Optional[str]) -> Optional[str]:
-        return value.lower() if value else value
-
 
 class CaptureResponse(BaseModel):
     """Response body returned after triggering an image capture."""
@@ -2,70 +2,180 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import logging
+import os
+import stat
+import time
 from pathlib import Path
+from threading import Lock
 from typing import Final
 
+import numpy as np
 from fastapi import HTTPException, status
-from PIL import Image
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover - enforced by requirements
+    cv2 = None
+
+logger = logging.getLogger(__name__)
+
+_MIME_BY_SUFFIX: Final[dict[str, str]] = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+_IMAGE_SUFFIXES: Final[tuple[str, ...]] = tuple(_MIME_BY_SUFFIX)
 
 
 class ImageStorage:
-    """File-system backed image storage."""
+    """File-system backed image storage with a creation-time expiry heap."""
 
-    _jpeg_suffixes: Final[tuple[str, ...]] = (".jpg", ".jpeg")
+    # Shared by all instances so identifiers stay unique within the process.
+    _id_sequence: Final[itertools.count] = itertools.count()
 
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, *, optimize_jpeg: bool = False) -> None:
         self.base_dir = base_dir
+        self.optimize_jpeg = optimize_jpeg
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # base_dir never changes, so resolve it once rather than per request.
+        self._resolved_base = self.base_dir.resolve()
+        self._expiry_lock = Lock()
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def new_image_id(self) -> str:
+        """Return a unique, time-ordered identifier for a new image."""
+        return f"{time.time_ns() // 1_000_000:013d}-{os.getpid()}-{next(self._id_sequence):06d}"
 
     def _build_path(self, image_id: str, image_format: str) -> Path:
         extension = "jpg" if image_format == "jpeg" else "png"
         return self.base_dir / f"{image_id}.{extension}"
 
-    def save_image(self, image: Image.Image, image_id: str, image_format: str, quality: int) -> Path:
-        """Persist the provided image to disk."""
+    def save_frame(self, frame: np.ndarray, image_id: str, image_format: str, quality: int) -> Path:
+        """
+        Encode a BGR frame and persist it to disk.
+
+        The frame is encoded straight from its buffer without an intermediate
+        copy, so callers must not mutate it until this returns.
+        """
+        if cv2 is None:  # pragma: no cover - enforced by requirements
+            raise RuntimeError("OpenCV is required to encode images.")
+
         file_path = self._build_path(image_id, image_format)
-        save_kwargs = {"format": image_format.upper()}
         if image_format == "jpeg":
-            save_kwargs["quality"] = quality
-            save_kwargs["optimize"] = True
-
-        image.save(file_path, **save_kwargs)
+            params = [
+                cv2.IMWRITE_JPEG_QUALITY,
+                quality,
+                cv2.IMWRITE_JPEG_OPTIMIZE,
+                int(self.optimize_jpeg),
+            ]
+            success, encoded = cv2.imencode(".jpg", frame, params)
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+            success, encoded = cv2.imencode(".png", frame, params)
+
+        if not success:
+            raise RuntimeError(f"Failed to encode image as {image_format}.")
+
+        file_path.write_bytes(encoded)
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (time.time(), file_path.name))
         return file_path
 
-    def resolve_image_path(self, filename: str) -> Path:
+    def index_existing_images(self) -> int:
+        """Track image files already on disk for expiry; return the count indexed."""
+        found: list[tuple[float, str]] = []
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_IMAGE_SUFFIXES):
+                    continue
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISREG(entry_stat.st_mode):
+                    found.append((entry_stat.st_mtime, entry.name))
+
+        with self._expiry_lock:
+            self._expiry_heap.extend(found)
+            heapq.heapify(self._expiry_heap)
+        return len(found)
+
+    def delete_expired(self, cutoff: float) -> int:
+        """Delete tracked images created before cutoff; return the count removed."""
+        expired: list[tuple[float, str]] = []
+        with self._expiry_lock:
+            while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+                expired.append(heapq.heappop(self._expiry_heap))
+
+        deleted = 0
+        failed: list[tuple[float, str]] = []
+        for entry in expired:
+            path = os.path.join(self.base_dir, entry[1])
+            try:
+                os.unlink(path)
+                deleted += 1
+            except FileNotFoundError:
+                # Already removed by someone else; the goal is met.
+                deleted += 1
+            except OSError as exc:
+                logger.warning(
+                    "Failed to delete old image",
+                    extra={"path": path, "error": str(exc)},
+                )
+                failed.append(entry)
+
+        if failed:
+            # Keep failed entries tracked so the next pass retries them.
+            with self._expiry_lock:
+                for entry in failed:
+                    heapq.heappush(self._expiry_heap, entry)
+        return deleted
+
+    def resolve_image_path(self, filename: str) -> tuple[Path, os.stat_result]:
         """
         Resolve filename within the storage directory, preventing path traversal.
 
-        Raises HTTPException with 404 if the file does not exist.
+        Returns the path together with its stat result so callers do not need
+        to stat the file again. Raises HTTPException with 400 for names that
+        could escape the directory and 404 if the file does not exist.
         """
-        candidate = (self.base_dir / filename).resolve()
+        # Reject obvious traversal attempts before touching the file system.
+        if "/" in filename or ".." in filename or "\x00" in filename:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid image path supplied.",
+            )
+
+        candidate = (self._resolved_base / filename).resolve()
 
         try:
-            candidate.relative_to(self.base_dir.resolve())
+            candidate.relative_to(self._resolved_base)
         except ValueError as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid image path supplied.",
             ) from exc
 
-        if not candidate.exists():
+        try:
+            stat_result = candidate.stat()
+        except FileNotFoundError:
+            stat_result = None
+
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Image not found.",
             )
 
-        return candidate
+        return candidate, stat_result
 
     @staticmethod
     def guess_media_type(file_path: Path) -> str:
         """Infer MIME type based on file suffix."""
-        suffix = file_path.suffix.lower()
-        if suffix in ImageStorage._jpeg_suffixes:
-            return "image/jpeg"
-        if suffix == ".png":
-            return "image/png"
-        return "application/octet-stream"
+        return _MIME_BY_SUFFIX.get(file_path.suffix.lower(), "application/octet-stream")
 
 
 
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures for the camera service tests."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings, get_settings
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    """Deterministic settings shared by every test in a module."""
+    return Settings(
+        camera_storage_dir=tmp_path_factory.mktemp("images"),
+        main_camera_source="dummy",
+        extra_camera_sources="",
+    )
+
+
+@pytest.fixture(scope="module")
+def client(settings: Settings) -> Iterator[TestClient]:
+    """
+    A TestClient whose lifespan runs once per module.
+
+    The settings override is installed before startup, because the lifespan
+    reads it to build the cameras and storage.
+    """
+    app.dependency_overrides[get_settings] = lambda: settings
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def dependency_overrides(client: TestClient) -> Iterator[dict[Callable[..., Any], Any]]:
+    """Per-test dependency overrides; everything except settings is reset afterwards."""
+    yield app.dependency_overrides
+    for dependency in list(app.dependency_overrides):
+        if dependency is not get_settings:
+            del app.dependency_overrides[dependency]
@@ -0,0 +1,173 @@
+"""Unit tests for CameraManager frame acquisition."""
+
+from __future__ import annotations
+
+import time
+from threading import Event, Lock
+
+import cv2
+import numpy as np
+import pytest
+
+from app.camera import CameraCaptureError, CameraManager
+
+
+class FakeVideoCapture:
+    """Minimal stand-in for cv2.VideoCapture producing numbered frames."""
+
+    def __init__(self, source, width: int = 64, height: int = 48) -> None:
+        self.source = source
+        self.width = width
+        self.height = height
+        self.fail_reads = False
+        self.read_targets: list[np.ndarray | None] = []
+        self.grabs = 0
+        self.released = False
+        self.read_gate: Event | None = None
+        self._lock = Lock()
+
+    def isOpened(self) -> bool:
+        return True
+
+    def set(self, prop, value) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        return True
+
+    def read(self, image=None):
+        time.sleep(0.002)
+        if self.read_gate is not None:
+            self.read_gate.wait()
+        if self.fail_reads:
+            return False, None
+        with self._lock:
+            self.read_targets.append(image)
+            if image is None:
+                image = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            image[:] = len(self.read_targets) % 256
+        return True, image
+
+    def release(self) -> None:
+        self.released = True
+
+
+@pytest.fixture
+def fake_capture(monkeypatch: pytest.MonkeyPatch) -> list[FakeVideoCapture]:
+    created: list[FakeVideoCapture] = []
+
+    def _factory(source):
+        capture = FakeVideoCapture(source)
+        created.append(capture)
+        return capture
+
+    monkeypatch.setattr(cv2, "VideoCapture", _factory)
+    return created
+
+
+def test_capture_returns_frame_from_reader_thread(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=2)
+    manager.start()
+    try:
+        native = manager.capture_fresh_frame((64, 48), "jpeg", 90)
+        resized = manager.capture_fresh_frame((32, 24), "jpeg", 90)
+    finally:
+        manager.stop()
+
+    capture = fake_capture[0]
+    assert native.shape == (48, 64, 3)
+    assert resized.shape == (24, 32, 3)
+    assert capture.grabs == 2
+    assert capture.released
+
+
+def test_returned_frames_are_not_overwritten_by_reader(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=0)
+    manager.start()
+    try:
+        first = manager.capture_fresh_frame((64, 48), "jpeg", 90)
+        value = int(first[0, 0, 0])
+        time.sleep(0.05)
+        manager.capture_fresh_frame((64, 48), "jpeg", 90)
+    finally:
+        manager.stop()
+
+    assert int(first[0, 0, 0]) == value
+    assert any(target is not None for target in fake_capture[0].read_targets)
+
+
+def test_capture_times_out_when_camera_stops_producing(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=0)
+    manager._frame_timeout_seconds = 0.1
+    manager.start()
+    try:
+        fake_capture[0].fail_reads = True
+        time.sleep(0.02)
+        with pytest.raises(CameraCaptureError):
+            manager.capture_fresh_frame((64, 48), "jpeg", 90)
+    finally:
+        manager.stop()
+
+
+def test_capture_after_stop_raises(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=0)
+    manager.start()
+    manager.stop()
+
+    with pytest.raises(CameraCaptureError):
+        manager.capture_fresh_frame((64, 48), "jpeg", 90)
+
+
+def test_stop_leaves_release_to_a_stuck_reader(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=0)
+    manager._reader_join_timeout_seconds = 0.05
+    manager.start()
+    capture = fake_capture[0]
+    capture.read_gate = Event()
+    reader = manager._reader
+    time.sleep(0.02)
+
+    manager.stop()
+    assert reader.is_alive()
+    assert not capture.released
+
+    capture.read_gate.set()
+    reader.join(timeout=1.0)
+    assert capture.released
+
+
+def test_dummy_frames_are_cached_only_up_to_the_pixel_budget() -> None:
+    manager = CameraManager(source="dummy")
+    manager.start()
+
+    small = manager.capture_fresh_frame((32, 24), "jpeg", 90)
+    assert manager.capture_fresh_frame((32, 24), "jpeg", 90) is small
+
+    large = manager.capture_fresh_frame((4000, 600), "jpeg", 90)
+    assert large.shape == (600, 4000, 3)
+    assert manager.capture_fresh_frame((4000, 600), "jpeg", 90) is not large
+
+
+def test_restart_does_not_revive_a_stuck_reader(fake_capture) -> None:
+    manager = CameraManager(source="0", warmup_frames=0)
+    manager._reader_join_timeout_seconds = 0.05
+    manager.start()
+    stuck_capture = fake_capture[0]
+    stuck_capture.read_gate = Event()
+    stuck_reader = manager._reader
+    time.sleep(0.02)
+    manager.stop()
+
+    manager.start()
+    try:
+        stuck_capture.read_gate.set()
+        stuck_reader.join(timeout=1.0)
+        assert not stuck_reader.is_alive()
+        assert stuck_capture.released
+
+        frame = manager.capture_fresh_frame((64, 48), "jpeg", 90)
+        assert frame.shape == (48, 64, 3)
+        assert not fake_capture[1].released
+    finally:
+        manager.stop()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
 import pytest
+from fastapi import FastAPI
 
 import app.main as main_module
 from app.camera import CameraInitializationError
-from app.config import Settings
+from app.config import Settings, get_settings
 
 
 def test_duplicate_main_and_extra_source_fails_fast() -> None:
@@ -18,7 +21,7 @@ def test_duplicate_main_and_extra_source_fails_fast() -> None:
     )
 
     with pytest.raises(SystemExit):
-        main_module.initialize_camera_managers(settings)
+        asyncio.run(main_module.initialize_camera_managers(settings))
 
 
 def test_main_camera_initialization_failure_exits_process(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -40,7 +43,7 @@ def test_main_camera_initialization_failure_exits_process(monkeypatch: pytest.Mo
     )
 
     with pytest.raises(SystemExit):
-        main_module.initialize_camera_managers(settings)
+        asyncio.run(main_module.initialize_camera_managers(settings))
 
 
 def test_extra_camera_failure_warns_and_continues(
@@ -66,8 +69,79 @@ def test_extra_camera_failure_warns_and_continues(
     )
 
     with caplog.at_level(logging.WARNING):
-        main_manager, extra_managers = main_module.initialize_camera_managers(settings)
+        main_manager, extra_managers = asyncio.run(main_module.initialize_camera_managers(settings))
 
     assert main_manager.source == "primary-main"
     assert [manager.source for manager in extra_managers] == ["extra-good", "extra-good-2"]
     assert "Failed to initialize extra camera source; ignoring source." in caplog.text
+
+
+def test_storage_failure_leaves_no_camera_running(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started: list[str] = []
+
+    class FakeCameraManager:
+        def __init__(self, device_index, source, warmup_frames, buffer_size) -> None:
+            self.source = source
+
+        def start(self) -> None:
+            started.append(self.source)
+
+        def stop(self) -> None:
+            started.remove(self.source)
+
+    monkeypatch.setattr(main_module, "CameraManager", FakeCameraManager)
+
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_bytes(b"")
+    settings = Settings(
+        camera_storage_dir=blocker,
+        main_camera_source="primary-main",
+        extra_camera_sources="extra-good",
+    )
+    app = FastAPI()
+    app.dependency_overrides[get_settings] = lambda: settings
+
+    async def _run_lifespan() -> None:
+        async with main_module.lifespan(app):
+            pass
+
+    with pytest.raises(OSError):
+        asyncio.run(_run_lifespan())
+    assert started == []
+
+
+def test_shutdown_stops_cameras_concurrently(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class SlowStopCameraManager:
+        def __init__(self, device_index, source, warmup_frames, buffer_size) -> None:
+            self.source = source
+            self.stopped = False
+
+        def start(self) -> None:
+            return None
+
+        def stop(self) -> None:
+            time.sleep(0.2)
+            self.stopped = True
+
+    monkeypatch.setattr(main_module, "CameraManager", SlowStopCameraManager)
+
+    settings = Settings(
+        camera_storage_dir=tmp_path,
+        main_camera_source="primary-main",
+        extra_camera_sources="extra-1,extra-2",
+    )
+    app = FastAPI()
+    app.dependency_overrides[get_settings] = lambda: settings
+
+    async def _run_lifespan() -> list[SlowStopCameraManager]:
+        async with main_module.lifespan(app):
+            managers = [app.state.camera_manager, *app.state.extra_camera_managers]
+        return managers
+
+    started_at = time.monotonic()
+    managers = asyncio.run(_run_lifespan())
+
+    assert all(manager.stopped for manager in managers)
+    assert time.monotonic() - started_at < 0.5
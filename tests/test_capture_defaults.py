@@ -4,17 +4,18 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
-from fastapi.testclient import TestClient
+import pytest
 
 from app.api import get_camera_manager, get_extra_camera_managers
-from app.config import Settings, get_settings
-from app.main import app
+from app.camera import CameraCaptureError
+from app.config import Settings
 
 
-def override_settings(tmp_path: Path) -> Settings:
-    """Utility to create deterministic settings for tests."""
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    """Deterministic settings for the capture tests."""
     return Settings(
-        camera_storage_dir=tmp_path,
+        camera_storage_dir=tmp_path_factory.mktemp("images"),
         camera_default_resolution="320x320",
         camera_default_format="jpeg",
         camera_default_quality=95,
@@ -25,98 +26,93 @@ def override_settings(tmp_path: Path) -> Settings:
     )
 
 
-def test_capture_defaults(tmp_path):
-    settings = override_settings(tmp_path)
+class DummyManager:
+    def __init__(self, fill: int = 0):
+        self.fill = fill
+        self.calls = 0
 
-    def _override_settings():
-        return settings
+    def capture_fresh_frame(self, resolution, format, quality):
+        self.calls += 1
+        width, height = resolution
+        return np.full((height, width, 3), self.fill, dtype=np.uint8)
 
-    app.dependency_overrides[get_settings] = _override_settings
-    try:
-        with TestClient(app) as client:
-            response = client.post("/capture", json={})
 
-        assert response.status_code == 200
-        payload = response.json()
+class FailingManager:
+    def capture_fresh_frame(self, resolution, format, quality):
+        raise CameraCaptureError("capture failed")
 
-        assert payload["image_url_or_path"].startswith("/api/images/")
-        assert "images" not in payload
-        assert Path(settings.camera_storage_dir / Path(payload["image_url_or_path"]).name).exists()
 
-        timestamp = datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00"))
-        assert timestamp.tzinfo == timezone.utc
-    finally:
-        app.dependency_overrides.clear()
+def test_capture_defaults(client, settings):
+    response = client.post("/capture", json={})
 
+    assert response.status_code == 200
+    payload = response.json()
 
-def test_capture_invokes_camera_manager_once(tmp_path):
-    settings = override_settings(tmp_path)
+    assert payload["image_url_or_path"].startswith("/api/images/")
+    assert "images" not in payload
+    assert Path(settings.camera_storage_dir / Path(payload["image_url_or_path"]).name).exists()
 
-    class DummyManager:
-        def __init__(self):
-            self.calls = 0
+    timestamp = datetime.fromisoformat(payload["timestamp"])
+    assert timestamp.tzinfo == timezone.utc
 
-        def capture_fresh_frame(self, resolution, format, quality):
-            self.calls += 1
-            width, height = resolution
-            return np.zeros((height, width, 3), dtype=np.uint8)
 
+def test_capture_invokes_camera_manager_once(client, settings, dependency_overrides):
     dummy_manager = DummyManager()
+    dependency_overrides[get_camera_manager] = lambda: dummy_manager
 
-    def _override_settings():
-        return settings
+    response = client.post("/capture", json={})
+    assert response.status_code == 200
+    payload = response.json()
 
-    app.dependency_overrides[get_settings] = _override_settings
-    app.dependency_overrides[get_camera_manager] = lambda: dummy_manager
+    assert dummy_manager.calls == 1
+    stored_file = settings.camera_storage_dir / Path(payload["image_url_or_path"]).name
+    assert stored_file.exists()
 
-    try:
-        with TestClient(app) as client:
-            response = client.post("/capture", json={})
-            assert response.status_code == 200
-            payload = response.json()
 
-        assert dummy_manager.calls == 1
-        stored_file = settings.camera_storage_dir / Path(payload["image_url_or_path"]).name
-        assert stored_file.exists()
-    finally:
-        app.dependency_overrides.clear()
+def test_capture_use_extra_includes_images_array(client, dependency_overrides):
+    main_manager = DummyManager()
+    extra_managers = [DummyManager(fill=1)]
+    dependency_overrides[get_camera_manager] = lambda: main_manager
+    dependency_overrides[get_extra_camera_managers] = lambda: extra_managers
 
+    response = client.post("/capture", json={"use_extra": True})
+    assert response.status_code == 200
+    payload = response.json()
 
-def test_capture_use_extra_includes_images_array(tmp_path):
-    settings = override_settings(tmp_path)
+    assert "images" in payload
+    assert len(payload["images"]) == 2
+    assert payload["images"][0]["index"] == 0
+    assert payload["images"][1]["index"] == 1
+    assert payload["image_id"] == payload["images"][0]["image_id"]
+    assert payload["image_url_or_path"] == payload["images"][0]["image_url_or_path"]
 
-    class DummyMainManager:
-        def capture_fresh_frame(self, resolution, format, quality):
-            width, height = resolution
-            return np.zeros((height, width, 3), dtype=np.uint8)
 
-    class DummyExtraManager:
-        def capture_fresh_frame(self, resolution, format, quality):
-            width, height = resolution
-            return np.ones((height, width, 3), dtype=np.uint8)
+def test_capture_use_extra_skips_failed_extra_camera(client, dependency_overrides):
+    main_manager = DummyManager()
+    extra_managers = [FailingManager(), DummyManager()]
+    dependency_overrides[get_camera_manager] = lambda: main_manager
+    dependency_overrides[get_extra_camera_managers] = lambda: extra_managers
 
-    main_manager = DummyMainManager()
-    extra_managers = [DummyExtraManager()]
+    response = client.post("/capture", json={"use_extra": True})
+    assert response.status_code == 200
+    payload = response.json()
 
-    def _override_settings():
-        return settings
+    assert [image["index"] for image in payload["images"]] == [0, 1]
+    assert payload["image_id"] == payload["images"][0]["image_id"]
 
-    app.dependency_overrides[get_settings] = _override_settings
-    app.dependency_overrides[get_camera_manager] = lambda: main_manager
-    app.dependency_overrides[get_extra_camera_managers] = lambda: extra_managers
 
-    try:
-        with TestClient(app) as client:
-            response = client.post("/capture", json={"use_extra": True})
-            assert response.status_code == 200
-            payload = response.json()
+def test_capture_use_extra_main_camera_failure_returns_500(
+    client, settings, dependency_overrides
+):
+    main_manager = FailingManager()
+    extra_manager = DummyManager()
+    dependency_overrides[get_camera_manager] = lambda: main_manager
+    dependency_overrides[get_extra_camera_managers] = lambda: [extra_manager]
+    stored_before = set(settings.camera_storage_dir.iterdir())
 
-        assert "images" in payload
-        assert len(payload["images"]) == 2
-        assert payload["images"][0]["index"] == 0
-        assert payload["images"][1]["index"] == 1
-        assert payload["image_id"] == payload["images"][0]["image_id"]
-        assert payload["image_url_or_path"] == payload["images"][0]["image_url_or_path"]
-    finally:
-        app.dependency_overrides.clear()
+    response = client.post("/capture", json={"use_extra": True})
 
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Camera capture failed."
+    assert extra_manager.calls == 1
+    assert set(settings.camera_storage_dir.iterdir()) == stored_before
@@ -0,0 +1,92 @@
+"""Tests for the background image cleanup loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import app.main as main_module
+from app.config import Settings
+from app.storage import ImageStorage
+
+
+def _write_image(path: Path, age_seconds: float) -> Path:
+    path.write_bytes(b"image")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+async def _run_single_pass(settings: Settings, storage: ImageStorage) -> None:
+    with ThreadPoolExecutor(max_workers=1) as io_pool:
+        task = asyncio.create_task(main_module.cleanup_loop(settings, storage, io_pool))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+def test_cleanup_removes_only_expired_images(tmp_path: Path) -> None:
+    settings = Settings(
+        camera_storage_dir=tmp_path,
+        main_camera_source="dummy",
+        camera_retention_seconds=60,
+        camera_cleanup_interval_seconds=3600,
+    )
+    expired = _write_image(tmp_path / "expired.jpg", age_seconds=120)
+    fresh = _write_image(tmp_path / "fresh.jpg", age_seconds=0)
+    foreign = _write_image(tmp_path / "upload.partial", age_seconds=120)
+    (tmp_path / "nested").mkdir()
+
+    storage = ImageStorage(tmp_path)
+    assert storage.index_existing_images() == 2
+    asyncio.run(_run_single_pass(settings, storage))
+
+    assert not expired.exists()
+    assert fresh.exists()
+    assert foreign.exists()
+    assert (tmp_path / "nested").is_dir()
+
+
+def test_delete_expired_removes_saved_frames(tmp_path: Path) -> None:
+    storage = ImageStorage(tmp_path)
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    saved = storage.save_frame(frame, storage.new_image_id(), "jpeg", 85)
+
+    assert storage.delete_expired(cutoff=time.time() - 60) == 0
+    assert saved.exists()
+
+    assert storage.delete_expired(cutoff=time.time() + 1) == 1
+    assert not saved.exists()
+    assert storage.delete_expired(cutoff=time.time() + 1) == 0
+
+
+def test_delete_expired_retries_failed_unlinks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = ImageStorage(tmp_path)
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    saved = storage.save_frame(frame, storage.new_image_id(), "jpeg", 85)
+
+    real_unlink = os.unlink
+    failures = iter([PermissionError("busy")])
+
+    def _flaky_unlink(path):
+        for exc in failures:
+            raise exc
+        real_unlink(path)
+
+    monkeypatch.setattr(os, "unlink", _flaky_unlink)
+
+    assert storage.delete_expired(cutoff=time.time() + 1) == 0
+    assert saved.exists()
+
+    assert storage.delete_expired(cutoff=time.time() + 1) == 1
+    assert not saved.exists()
@@ -0,0 +1,38 @@
+"""Integration tests for serving stored images."""
+
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings
+
+
+@pytest.fixture(scope="module")
+def settings(settings: Settings) -> Settings:
+    """Shared settings with a short, recognisable retention period."""
+    return settings.model_copy(update={"camera_retention_seconds": 120})
+
+
+def test_fetch_image_returns_cacheable_file(client, settings):
+    capture = client.post("/capture", json={"format": "png"})
+    assert capture.status_code == 200
+    response = client.get(capture.json()["image_url_or_path"])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["cache-control"] == "public, max-age=120, immutable"
+    stored_file = settings.camera_storage_dir / Path(capture.json()["image_url_or_path"]).name
+    assert response.content == stored_file.read_bytes()
+    assert response.headers["content-length"] == str(stored_file.stat().st_size)
+
+
+def test_fetch_missing_image_returns_404(client):
+    response = client.get("/api/images/missing.jpg")
+
+    assert response.status_code == 404
+
+
+def test_fetch_image_rejects_traversal_names(client):
+    response = client.get("/api/images/..secret.jpg")
+
+    assert response.status_code == 400
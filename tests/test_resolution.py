@@ -3,6 +3,7 @@
 import pytest
 
 from app.camera import parse_resolution
+from app.models import CaptureRequest
 
 
 def test_parse_resolution_valid():
@@ -18,5 +19,5 @@ def test_parse_resolution_invalid(resolution):
         parse_resolution(resolution)
 
 
-
-
+def test_capture_request_lowercases_resolution():
+    assert CaptureRequest(resolution="640X480").resolution == "640x480"